@@ -5,33 +5,46 @@ Features: Real-time updates, interactive charts, live status indicators, animate
 """
 
 import os
+import re
+import functools
 from pathlib import Path
 import time
 import random
+from collections import namedtuple
 from datetime import datetime, timedelta
+from xml.sax.saxutils import escape as _xml_escape
 import pandas as pd
 import numpy as np
 
 import streamlit as st
-from streamlit_folium import st_folium
-import plotly.graph_objects as go
-import plotly.express as px
 
+try:
+    # Client-side timer; avoids polling for refreshes on the server
+    from streamlit_autorefresh import st_autorefresh
+except Exception:
+    st_autorefresh = None
+
+# llm_insights, translate, tts and live_weather pull in network clients
+# (openai, googletrans, gTTS); they are imported on first use below.
 from src import (
     data_loader,
     routing,
     fusion_engine,
-    llm_insights,
-    translate,
     alerting,
     authority,
     gps_mock,
     ux,
     risk_disaster,
     risk_crowd,
-    tts,
-    live_weather,
 )
+from src.risk_history import RiskHistory
+from src.constants import I18N, I18N_NS, STATES, STATE_CENTERS, STATE_PATHS
+
+
+@functools.lru_cache(maxsize=1)
+def _st_folium():
+    from streamlit_folium import st_folium
+    return st_folium
 
 
 def build_gpx(route, name="Safe route"):
@@ -40,16 +53,17 @@ def build_gpx(route, name="Safe route"):
     imported into Garmin / GPS devices.
     """
     try:
-        from xml.etree.ElementTree import Element, SubElement, tostring
-
-        gpx = Element("gpx", version="1.1", creator="CrowdShield")
-        trk = SubElement(gpx, "trk")
-        name_el = SubElement(trk, "name")
-        name_el.text = name
-        seg = SubElement(trk, "trkseg")
-        for lat, lon in route:
-            SubElement(seg, "trkpt", lat=str(lat), lon=str(lon))
-        return tostring(gpx, encoding="utf-8", xml_declaration=True)
+        # The schema is trivial, so emit the XML directly instead of
+        # building an ElementTree with one element per waypoint.
+        parts = [
+            '<?xml version="1.0" encoding="utf-8"?>',
+            '<gpx version="1.1" creator="CrowdShield"><trk><name>',
+            _xml_escape(name),
+            "</name><trkseg>",
+        ]
+        parts.extend(f'<trkpt lat="{lat:.6f}" lon="{lon:.6f}"/>' for lat, lon in route)
+        parts.append("</trkseg></trk></gpx>")
+        return "".join(parts).encode("utf-8")
     except Exception as e:
         print(f"GPX build error: {e}")
         return None
@@ -72,77 +86,329 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# -------- Multilingual dictionary --------
-I18N = {
-    "en": {
-        "title": "CrowdShield Demo", "state": "Select state", "map": "Safety Map",
-        "drivers": "Drivers", "severity": "Severity Tier", "advisory": "LLM Advisory",
-        "risk_crowd": "Crowd risk", "risk_disaster": "Disaster risk",
-        "recommendations": "Recommendations", "nearest": "Nearest shelter",
-        "eta": "ETA", "distance": "Distance", "instructions": "Route instructions",
-        "safety_methods": "Safety methods", "live_status": "Live Status",
-        "refresh_rate": "Auto-refresh (seconds)", "enable_auto_refresh": "Enable Auto-Refresh",
-        "real_time_data": "Real-time Data", "history": "Risk History",
-        "current_conditions": "Current Conditions", "alerts_active": "Active Alerts"
-    },
-    "hi": {
-        "title": "क्राउडशील्ड डेमो", "state": "राज्य चुनें", "map": "सुरक्षा मानचित्र",
-        "drivers": "ड्राइवर्स", "severity": "गंभीरता स्तर", "advisory": "एलएलएम सलाह",
-        "risk_crowd": "भीड़ जोखिम", "risk_disaster": "आपदा जोखिम",
-        "recommendations": "सिफारिशें", "nearest": "निकटतम शेल्टर",
-        "eta": "अनुमानित समय", "distance": "दूरी", "instructions": "रूट निर्देश",
-        "safety_methods": "सुरक्षा उपाय", "live_status": "लाइव स्थिति",
-        "refresh_rate": "ऑटो-रिफ्रेश (सेकंड)", "enable_auto_refresh": "ऑटो-रिफ्रेश सक्षम करें",
-        "real_time_data": "रीयल-टाइम डेटा", "history": "जोखिम इतिहास",
-        "current_conditions": "वर्तमान स्थितियां", "alerts_active": "सक्रिय अलर्ट"
-    },
-    "ml": {
-        "title": "ക്രൗഡ്‌ഷീൽഡ് ഡെമോ", "state": "സംസ്ഥാനം തിരഞ്ഞെടുക്കുക", "map": "സുരക്ഷാ മാപ്പ്",
-        "drivers": "ഡ്രൈവർസ്", "severity": "ഗൗരവത്വം", "advisory": "എൽഎൽഎം ഉപദേശം",
-        "risk_crowd": "ജനക്കൂട്ട അപകടം", "risk_disaster": "ദുരന്ത അപകടം",
-        "recommendations": "ശുപാർശകൾ", "nearest": "അടുത്ത അഭയം",
-        "eta": "എത്താൻ വേണ്ട സമയം", "distance": "ദൂരം", "instructions": "റൂട്ടു നിർദ്ദേശങ്ങൾ",
-        "safety_methods": "സുരക്ഷാ രീതികൾ", "live_status": "ലൈവ് സ്ഥിതി",
-        "refresh_rate": "ഓട്ടോ-റിഫ്രഷ് (സെക്കൻഡ്)", "enable_auto_refresh": "ഓട്ടോ-റിഫ്രഷ് പ്രവർത്തനക്ഷമമാക്കുക",
-        "real_time_data": "റിയൽ-ടൈം ഡാറ്റ", "history": "റിസ്ക് ചരിത്രം",
-        "current_conditions": "നിലവിലെ വ്യവസ്ഥകൾ", "alerts_active": "സജീവമായ അലേർട്ടുകൾ"
-    },
-    "ta": {
-        "title": "கூட்டம் பாதுகாப்பு டெமோ", "state": "மாநிலத்தைத் தேர்ந்தெடுக்கவும்", "map": "பாதுகாப்பு வரைபடம்",
-        "drivers": "டிரைவர்கள்", "severity": "தீவிர நிலை", "advisory": "LLM ஆலோசனை",
-        "risk_crowd": "கூட்டம் அபாயம்", "risk_disaster": "பேரழிவு அபாயம்",
-        "recommendations": "பரிந்துரைகள்", "nearest": "அருகிலுள்ள தங்குமிடம்",
-        "eta": "வருகை நேரம்", "distance": "தூரம்", "instructions": "பாதை வழிமுறைகள்",
-        "safety_methods": "பாதுகாப்பு முறைகள்", "live_status": "நேரடி நிலை",
-        "refresh_rate": "ஆட்டோ-ரெஃப்ரெஷ் (விநாடிகள்)", "enable_auto_refresh": "ஆட்டோ-ரெஃப்ரெஷ் இயக்கு",
-        "real_time_data": "நேரடி தரவு", "history": "ஆபத்து வரலாறு",
-        "current_conditions": "தற்போதைய நிலைமைகள்", "alerts_active": "செயலில் உள்ள அலாரங்கள்"
-    }
+# Emoji shown next to risk drivers; one case-insensitive scan per driver
+_ICON_MAP = {
+    "rainfall": "🌧️",
+    "wind": "💨",
+    "flood": "🌊",
+    "crowd": "👥",
+    "density": "📊",
 }
+_ICON_RE = re.compile("(" + "|".join(_ICON_MAP) + ")", re.IGNORECASE)
 
-STATES = [
-    "Kerala", "Tamil Nadu", "Karnataka", "Maharashtra",
-    "Uttar Pradesh", "Delhi", "West Bengal", "Rajasthan"
-]
 
-# Approximate map centres for supported states so the map pans
-# to the selected region instead of always showing Kochi.
-STATE_CENTERS = {
-    "Kerala": (10.1632, 76.6413),
-    "Tamil Nadu": (11.1271, 78.6569),
-    "Karnataka": (15.3173, 75.7139),
-    "Maharashtra": (19.7515, 75.7139),
-    "Uttar Pradesh": (26.8467, 80.9462),
-    "Delhi": (28.6139, 77.2090),
-    "West Bengal": (22.9868, 87.8550),
-    "Rajasthan": (27.0238, 74.2179),
-}
+def _icon_for(driver):
+    m = _ICON_RE.search(driver)
+    return _ICON_MAP[m.group(1).lower()] if m else "⚠️"
+
+
+StateCtx = namedtuple("StateCtx", "center_point origin haz_path shel_path crowd_path")
+
+
+# Everything below only depends on the selected state. cache_resource (not
+# cache_data) because the namedtuple is immutable and need not be pickled.
+@st.cache_resource(show_spinner=False)
+def _state_ctx(state: str) -> StateCtx:
+    # Center map on the selected state; fall back to Kochi demo center.
+    # Use a state-specific mock origin so the route and markers
+    # appear in the selected region instead of always Kerala.
+    return StateCtx(
+        STATE_CENTERS.get(state, (9.931233, 76.267304)),
+        gps_mock.get_mock_location_for_state(state),
+        *STATE_PATHS[state],
+    )
+
+# -------- Cached data loaders --------
+# Streamlit reruns the whole script on every widget change / auto-refresh tick,
+# so keep parsed GeoJSON/CSV in memory. An empty path means "use the default
+# dataset" and keeps the cache key hashable.
+@st.cache_data(show_spinner=False, ttl=300)
+def _cached_load_hazards(path: str):
+    return data_loader.load_hazards(path) if path else data_loader.load_hazards()
+
+
+@st.cache_data(show_spinner=False, ttl=300)
+def _cached_load_shelters(path: str):
+    return data_loader.load_shelters(path) if path else data_loader.load_shelters()
+
+
+@st.cache_data(show_spinner=False, ttl=300)
+def _cached_load_crowd(path: str):
+    return data_loader.load_crowd(path) if path else data_loader.load_crowd()
+
+
+@st.cache_data(show_spinner=False)
+def _scaled_crowd(path: str, density: float) -> pd.DataFrame:
+    """Crowd telemetry rescaled to the density slider, as a new frame."""
+    df = _cached_load_crowd(path).copy()
+    if not df.empty and "people" in df.columns:
+        base = df["people"].to_numpy(np.float64)
+        m = base.mean() / 1000.0
+        df["people"] = base * (density / max(1.0, m))
+    return df
+
+
+# -------- Cached routing graph --------
+# routing.get_graph caches the OSMnx walk graph per (online, center_point);
+# the hazard-blocked copy is cached here on top of it.
+def _hash_hazards(hazards):
+    """
+    Content fingerprint of a hazards frame (attributes + geometry as WKB),
+    stable across the fresh copies returned by the cached loader.
+    """
+    if hazards is None or getattr(hazards, "empty", True):
+        return 0
+    frame = pd.DataFrame(hazards.drop(columns="geometry", errors="ignore"))
+    if "geometry" in hazards.columns:
+        frame["_wkb"] = hazards.geometry.to_wkb(hex=True)
+    return int(pd.util.hash_pandas_object(frame, index=False).sum())
+
+
+@st.cache_resource(show_spinner=False)
+def _get_blocked_graph(center_point: tuple, offline: bool, hazards_hash: int, _hazards):
+    # `_hazards` is not hashed by Streamlit; `hazards_hash` stands in for it.
+    G = routing.get_graph(online=not offline, center_point=center_point)
+    if G is None:
+        # raise so the miss is not cached and the next rerun retries the load
+        raise LookupError("road graph unavailable")
+    return routing.block_edges_by_hazards(G, _hazards)
+
+
+# -------- Cached map --------
+# Rebuilding the folium map is only needed when something drawn on it
+# changes; `map_key` fingerprints those inputs and the underscore-prefixed
+# arguments are excluded from Streamlit's hashing.
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _build_map(map_key, _center_point, _hazards, _shelters, _origin, _reports,
+               _target_coord, _target_name, _route):
+    m = ux.create_base_map(center_point=_center_point, zoom_start=15)
+    if m is None:
+        return None
+
+    # Add hazards if available
+    try:
+        if _hazards is not None and not _hazards.empty:
+            ux.add_hazards_to_map(m, _hazards)
+    except Exception as e:
+        st.warning(f"Could not add hazards to map: {e}")
+
+    # Add shelters if available
+    try:
+        if _shelters is not None and not _shelters.empty:
+            ux.add_shelters_to_map(m, _shelters)
+    except Exception as e:
+        st.warning(f"Could not add shelters to map: {e}")
+
+    # Add origin point
+    try:
+        ux.add_origin_to_map(m, _origin)
+    except Exception as e:
+        st.warning(f"Could not add origin to map: {e}")
+
+    # Add user crowd reports
+    try:
+        ux.add_reports_to_map(m, _reports)
+    except Exception as e:
+        st.warning(f"Could not add reports to map: {e}")
+
+    # Highlight chosen target shelter
+    try:
+        import folium
+        folium.CircleMarker(
+            location=_target_coord,
+            radius=10,
+            color="purple",
+            fill=True,
+            fillColor="purple",
+            popup=folium.Popup(f"<b>Target Shelter</b><br>{_target_name}", max_width=200),
+            tooltip=f"Target: {_target_name}"
+        ).add_to(m)
+    except Exception as e:
+        st.warning(f"Could not add target marker: {e}")
+
+    # Add route if available
+    if _route:
+        try:
+            ux.add_route_to_map(m, _route)
+        except Exception as e:
+            st.warning(f"Could not add route to map: {e}")
+    return m
+
+
+# The map lives in its own fragment: interacting with it (pan, zoom, click)
+# reruns only this function instead of the whole script.
+@st.fragment
+def render_map(center_point, hazards, shelters, origin, route, reports, target_coord, target_name):
+    # Build (or reuse the cached) map with enhanced error handling
+    try:
+        map_key = (
+            center_point,
+            _hash_hazards(hazards),
+            0 if shelters is None or shelters.empty else int(pd.util.hash_pandas_object(shelters, index=False).sum()),
+            tuple(origin),
+            tuple(tuple(p) for p in (route or ())),
+            target_coord,
+            target_name,
+            tuple(
+                (r.get("lat"), r.get("lon"), r.get("type"), r.get("severity"), r.get("note"), r.get("timestamp"))
+                for r in reports
+            ),
+        )
+        m = _build_map(
+            map_key, center_point, hazards, shelters, origin,
+            reports, target_coord, target_name, route,
+        )
+        
+        if m is None:
+            st.error("Failed to create map. Please check your folium installation.")
+        else:
+            # Render map in Streamlit - simplified for reliability
+            try:
+                # Try simple st_folium first
+                _st_folium()(m, width=700, height=600, key="main_map")
+            except Exception as e:
+                st.error(f"Map rendering error: {str(e)}")
+                # Fallback: try to render with HTML directly
+                try:
+                    import folium
+                    html_str = m._repr_html_()
+                    st.components.v1.html(html_str, width=700, height=600)
+                    st.info("Map rendered using HTML fallback method.")
+                except Exception as e2:
+                    st.error(f"Fallback map rendering failed: {str(e2)}")
+                    # Last resort: create and show minimal map
+                    try:
+                        minimal = folium.Map(location=center_point, zoom_start=15)
+                        _st_folium()(minimal, width=700, height=600, key="minimal_map")
+                    except:
+                        st.error("Could not display map. Please check your Streamlit and Folium installation.")
+                    
+    except Exception as e:
+        st.error(f"Critical map creation error: {str(e)}")
+        import traceback
+        st.code(traceback.format_exc())
+        # Last resort: create a minimal map
+        try:
+            import folium
+            minimal_map = folium.Map(location=center_point, zoom_start=15)
+            _st_folium()(minimal_map, width=700, height=600, key="fallback_map")
+            st.info("Displaying minimal map as fallback.")
+        except Exception as e2:
+            st.error(f"Could not create fallback map: {str(e2)}")
+
+
+# -------- Cached advisory / translation --------
+# LLM and translation calls are network round-trips; memoize them so slider
+# jitter and auto-refresh ticks reuse the previous result.
+@st.cache_data(ttl=120, show_spinner=False)
+def _cached_advisory(severity, drivers_key, role):
+    from src import llm_insights
+    return llm_insights.generate_advisory(severity, list(drivers_key), role=role)
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _cached_translate(text, dest):
+    from src import translate
+    return translate.translate(text, dest=dest)
+
+
+# Identical advisory text + language always yields the same audio.
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_tts(text: str, lang: str) -> str:
+    from src import tts
+    path = tts.generate_tts(text, lang=lang)
+    if not path.endswith(".mp3"):
+        # .txt fallback after a failed synthesis; raise so it is not cached
+        raise RuntimeError(path)
+    return path
+
+
+# Weather changes on the minute scale, not per auto-refresh tick.
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_live_weather(state: str):
+    from src import live_weather
+    return live_weather.fetch_weather_for_state(state)
+
+
+# -------- Charts --------
+# The history gains a point on every full run, so its figure is rebuilt each
+# time; the gauge inputs repeat and are cached as plain dicts, since
+# go.Figure(dict) on a hit is much cheaper than rebuilding traces.
+def build_history_fig(history: pd.DataFrame):
+    """history: RiskHistory.to_df(), one column per score."""
+    import plotly.graph_objects as go
+
+    ts = history["timestamp"]
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=ts,
+        y=history["disaster_score"],
+        mode='lines+markers',
+        name='Disaster Risk',
+        line=dict(color='#E67E22', width=2)
+    ))
+    fig.add_trace(go.Scatter(
+        x=ts,
+        y=history["crowd_score"],
+        mode='lines+markers',
+        name='Crowd Risk',
+        line=dict(color='#3498DB', width=2)
+    ))
+    fig.add_trace(go.Scatter(
+        x=ts,
+        y=history["combined"],
+        mode='lines+markers',
+        name='Combined Risk',
+        line=dict(color='#E74C3C', width=3)
+    ))
+    fig.update_layout(
+        title="Risk Scores Over Time",
+        xaxis_title="Time",
+        yaxis_title="Risk Score (0-1)",
+        hovermode='x unified',
+        height=300
+    )
+    return fig
+
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def gauge_fig(bucket: int, bar_color: str) -> dict:
+    """Gauge for a score bucketed to 5% steps (bucket 0-20)."""
+    import plotly.graph_objects as go
+
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number+delta",
+        value=bucket * 5,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        title={'text': "Disaster Risk Level"},
+        delta={'reference': 50},
+        gauge={
+            'axis': {'range': [None, 100]},
+            'bar': {'color': bar_color},
+            'steps': [
+                {'range': [0, 25], 'color': "#2ECC71"},
+                {'range': [25, 50], 'color': "#F5B041"},
+                {'range': [50, 75], 'color': "#E67E22"},
+                {'range': [75, 100], 'color': "#C0392B"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 90
+            }
+        }
+    ))
+    fig.update_layout(height=300)
+    return fig.to_dict()
+
 
 # -------- Session State Initialization --------
 if "risk_history" not in st.session_state:
-    st.session_state.risk_history = []
+    st.session_state.risk_history = RiskHistory(maxlen=50)
 if "last_update" not in st.session_state:
     st.session_state.last_update = datetime.now()
+if "last_update_mono" not in st.session_state:
+    st.session_state.last_update_mono = time.monotonic()
 if "auto_refresh_enabled" not in st.session_state:
     st.session_state.auto_refresh_enabled = False
 if "refresh_interval" not in st.session_state:
@@ -163,9 +429,9 @@ if "scenario_trigger_crowd" not in st.session_state:
 # -------- Sidebar controls --------
 st.sidebar.title("🛡️ " + I18N[st.session_state.get("lang", "en")].get("title", "CrowdShield Demo"))
 lang = st.sidebar.selectbox("Language / भाषा / ഭാഷ / மொழி", options=list(I18N.keys()), index=0, key="lang_selector")
-i18n = I18N[lang]
+i18n = I18N_NS[lang]
 
-state = st.sidebar.selectbox(i18n["state"], options=STATES, index=0, key="state_selector")
+state = st.sidebar.selectbox(i18n.state, options=STATES, index=0, key="state_selector")
 role = st.sidebar.radio("User role", ["Citizen", "Authority"], index=0, key="role_selector")
 
 # Scenario presets: set scenario flags and slider defaults
@@ -217,16 +483,17 @@ route_mode = st.sidebar.radio("Route Mode", ["Shortest", "Fastest", "Safest"], i
 find_route = st.sidebar.button("🔍 Find Safe Route", width="stretch")
 
 st.sidebar.markdown("### 🔄 Live Updates")
-auto_refresh = st.sidebar.checkbox(i18n["enable_auto_refresh"], value=st.session_state.auto_refresh_enabled, key="auto_refresh_check")
+auto_refresh = st.sidebar.checkbox(i18n.enable_auto_refresh, value=st.session_state.auto_refresh_enabled, key="auto_refresh_check")
 if auto_refresh:
     st.session_state.auto_refresh_enabled = True
-    refresh_seconds = st.sidebar.slider(i18n["refresh_rate"], 2, 30, st.session_state.refresh_interval, 1, key="refresh_rate_slider")
+    refresh_seconds = st.sidebar.slider(i18n.refresh_rate, 2, 30, st.session_state.refresh_interval, 1, key="refresh_rate_slider")
     st.session_state.refresh_interval = refresh_seconds
 else:
     st.session_state.auto_refresh_enabled = False
 
 if st.sidebar.button("🔄 Manual Refresh", width="stretch"):
     st.session_state.last_update = datetime.now()
+    st.session_state.last_update_mono = time.monotonic()
     st.rerun()
 
 st.sidebar.markdown("### 📢 Alerts")
@@ -249,7 +516,7 @@ with st.sidebar.form("report_form"):
 
 if submitted_report:
     # Attach report to current origin location (best proxy we have without geolocation)
-    origin_lat, origin_lon = gps_mock.get_mock_location_for_state(st.session_state.get("state_selector", state))
+    origin_lat, origin_lon = _state_ctx(st.session_state.get("state_selector", state)).origin
     st.session_state.reports.append(
         {
             "lat": origin_lat,
@@ -267,40 +534,41 @@ st.sidebar.caption("💡 Tip: Enable auto-refresh for live updates. Adjust slide
 
 # Auto-refresh logic
 if st.session_state.auto_refresh_enabled:
-    time_since_update = (datetime.now() - st.session_state.last_update).total_seconds()
+    if st_autorefresh is not None:
+        st_autorefresh(interval=st.session_state.refresh_interval * 1000, key="auto_refresh")
+    time_since_update = time.monotonic() - st.session_state.last_update_mono
     if time_since_update >= st.session_state.refresh_interval:
+        st.session_state.last_update_mono = time.monotonic()
         st.session_state.last_update = datetime.now()
-        time.sleep(0.1)  # Small delay to prevent rapid reruns
-        st.rerun()
+        if st_autorefresh is None:
+            st.rerun()
 
 # -------- Load data --------
-haz_path = f"data/hazard_zones_{state.lower().replace(' ', '_')}.geojson"
-shel_path = f"data/safe_zones_{state.lower().replace(' ', '_')}.csv"
-crowd_path = f"data/crowd_sim_{state.lower().replace(' ', '_')}.csv"
+ctx = _state_ctx(state)
+haz_path, shel_path, crowd_path = ctx.haz_path, ctx.shel_path, ctx.crowd_path
 
 try:
-    hazards = data_loader.load_hazards(haz_path) if Path(haz_path).exists() else data_loader.load_hazards()
+    hazards = _cached_load_hazards(haz_path if Path(haz_path).exists() else "")
 except Exception as e:
     st.warning(f"Could not load hazards: {e}")
-    hazards = data_loader.load_hazards()
+    hazards = _cached_load_hazards("")
 
 try:
-    shelters = data_loader.load_shelters(shel_path) if Path(shel_path).exists() else data_loader.load_shelters()
+    shelters = _cached_load_shelters(shel_path if Path(shel_path).exists() else "")
 except Exception as e:
     st.warning(f"Could not load shelters: {e}")
-    shelters = data_loader.load_shelters()
+    shelters = _cached_load_shelters("")
 
+crowd_src = crowd_path if Path(crowd_path).exists() else ""
 try:
-    crowd_sim = data_loader.load_crowd(crowd_path) if Path(crowd_path).exists() else data_loader.load_crowd()
-    # Simulate crowd density if slider is used
-    if not crowd_sim.empty and "people" in crowd_sim.columns:
-        crowd_sim["people"] = crowd_sim["people"] * (crowd_density / max(1.0, crowd_sim["people"].mean() / 1000))
+    # Simulate crowd density from the slider (cached per path + density)
+    crowd_sim = _scaled_crowd(crowd_src, float(crowd_density))
 except Exception as e:
     st.warning(f"Could not load crowd data: {e}")
-    crowd_sim = data_loader.load_crowd()
+    crowd_sim = _cached_load_crowd("")
 
 # Live weather (optional) + slider override for interactivity
-live_wx = live_weather.fetch_weather_for_state(state)
+live_wx = _cached_live_weather(state)
 if live_wx:
     base_rain = live_wx["rainfall_mm"]
     base_wind = live_wx["wind_kph"]
@@ -315,41 +583,57 @@ weather = {
     "timestamp": datetime.now().timestamp(),
 }
 
-# -------- Risk scoring --------
-try:
-    disaster_score, drivers = risk_disaster.score_disaster(weather, trigger_flood)
-    crowd_score, crowd_drivers = risk_crowd.score_crowd(crowd_sim, trigger_crowd)
-except Exception as e:
-    st.error(f"Risk scoring error: {e}")
-    disaster_score, drivers = 0.0, ["Error in disaster scoring"]
-    crowd_score, crowd_drivers = 0.0, ["Error in crowd scoring"]
+# -------- Risk scoring + advisory --------
+# Scoring, fusion, the LLM advisory and its translation only depend on the
+# inputs below. Reruns triggered by UI-only widgets (charts, audio, map
+# interaction) reuse the previous results instead of recomputing them.
+pipeline_fp = (
+    weather["rainfall_mm"],
+    weather["wind_kph"],
+    trigger_flood,
+    trigger_crowd,
+    crowd_src,
+    float(crowd_density),
+    lang,
+    role,
+)
+if st.session_state.get("_pipeline_fp") == pipeline_fp:
+    (
+        severity, recommendations, drivers, crowd_drivers,
+        disaster_score, crowd_score, advisory_en, advisory_out,
+    ) = st.session_state["_pipeline_cached"]
+else:
+    try:
+        disaster_score, drivers = risk_disaster.score_disaster(weather, trigger_flood)
+        crowd_score, crowd_drivers = risk_crowd.score_crowd(crowd_sim, trigger_crowd)
+    except Exception as e:
+        st.error(f"Risk scoring error: {e}")
+        disaster_score, drivers = 0.0, ["Error in disaster scoring"]
+        crowd_score, crowd_drivers = 0.0, ["Error in crowd scoring"]
 
-try:
-    severity, recommendations = fusion_engine.fuse(disaster_score, crowd_score, i18n=i18n)
-except Exception as e:
-    st.error(f"Fusion error: {e}")
-    severity, recommendations = "Medium", ["Error in fusion engine"]
-
-# Update risk history for charts
-current_time = datetime.now()
-st.session_state.risk_history.append({
-    "timestamp": current_time,
-    "disaster_score": disaster_score,
-    "crowd_score": crowd_score,
-    "combined": max(disaster_score, crowd_score * 0.9),
-    "severity": severity
-})
-# Keep only last 50 points
-if len(st.session_state.risk_history) > 50:
-    st.session_state.risk_history = st.session_state.risk_history[-50:]
-
-# -------- Advisory --------
-try:
-    advisory_en = llm_insights.generate_advisory(severity, drivers + crowd_drivers, role="Authority")
-    advisory_out = translate.translate(advisory_en, dest=lang) if lang != "en" else advisory_en
-except Exception as e:
-    st.warning(f"Advisory generation error: {e}")
-    advisory_out = f"{severity} advisory: Follow local safety instructions."
+    try:
+        severity, recommendations = fusion_engine.fuse(disaster_score, crowd_score, i18n=I18N[lang])
+    except Exception as e:
+        st.error(f"Fusion error: {e}")
+        severity, recommendations = "Medium", ["Error in fusion engine"]
+
+    try:
+        advisory_en = _cached_advisory(severity, tuple(drivers + crowd_drivers), "Authority")
+        advisory_out = _cached_translate(advisory_en, lang) if lang != "en" else advisory_en
+    except Exception as e:
+        st.warning(f"Advisory generation error: {e}")
+        advisory_out = f"{severity} advisory: Follow local safety instructions."
+        advisory_en = advisory_out
+
+    st.session_state["_pipeline_fp"] = pipeline_fp
+    st.session_state["_pipeline_cached"] = (
+        severity, recommendations, drivers, crowd_drivers,
+        disaster_score, crowd_score, advisory_en, advisory_out,
+    )
+
+# Update risk history for charts (keeps the last 50 points)
+combined_risk = max(disaster_score, crowd_score * 0.9)
+st.session_state.risk_history.append(disaster_score, crowd_score, combined_risk)
 
 # -------- Main Layout --------
 # Header with live status
@@ -358,7 +642,7 @@ with col_header1:
     st.title("🛡️ CrowdShield — AI Disaster Copilot")
 with col_header2:
     status_color = {"Low": "🟢", "Medium": "🟡", "High": "🟠", "Critical": "🔴"}.get(severity, "⚪")
-    st.metric(i18n["live_status"], f"{status_color} {severity}")
+    st.metric(i18n.live_status, f"{status_color} {severity}")
 with col_header3:
     update_time = st.session_state.last_update.strftime("%H:%M:%S")
     st.caption(f"Last update: {update_time}")
@@ -371,9 +655,8 @@ st.markdown("---")
 left_col, right_col = st.columns([2, 1])
 
 with left_col:
-    st.subheader(i18n["map"])
-    # Center map on the selected state; fall back to Kochi demo center.
-    center_point = STATE_CENTERS.get(state, (9.931233, 76.267304))
+    st.subheader(i18n.map)
+    center_point = ctx.center_point
     
     # Debug info (can be toggled off later)
     with st.expander("🔍 Map Debug Info", expanded=False):
@@ -389,7 +672,7 @@ with left_col:
                 import folium
                 test_map = folium.Map(location=center_point, zoom_start=15)
                 test_map.add_child(folium.Marker(location=center_point, popup="Test Marker"))
-                st_folium(test_map, width=700, height=400, key="test_map")
+                _st_folium()(test_map, width=700, height=400, key="test_map")
                 st.success("✅ Test map displayed successfully!")
             except Exception as e:
                 st.error(f"❌ Test map failed: {str(e)}")
@@ -398,35 +681,29 @@ with left_col:
     
     try:
         # Load and block graph
-        G = routing.load_graph(online=not offline_mode, center_point=center_point)
-        G_blocked = routing.block_edges_by_hazards(G, hazards)
+        G_blocked = _get_blocked_graph(center_point, offline_mode, _hash_hazards(hazards), hazards)
+    except LookupError:
+        G_blocked = None
     except Exception as e:
         st.warning(f"Graph loading error: {e}, using fallback")
         G_blocked = None
     
     # Define origin and target.
-    # Use a state-specific mock origin so the route and markers
-    # appear in the selected region instead of always Kerala.
-    origin = gps_mock.get_mock_location_for_state(state)
-    
-    # Choose nearest shelter dynamically
-    import math
-    def haversine_km(p1, p2):
-        lat1, lon1 = p1
-        lat2, lon2 = p2
-        R = 6371.0
-        dlat = math.radians(lat2 - lat1)
-        dlon = math.radians(lon2 - lon1)
-        a = math.sin(dlat/2)**2 + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(dlon/2)**2
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-        return R * c
+    origin = ctx.origin
     
-    shelters_list = [(float(row.lat), float(row.lon), row.name) for _, row in shelters.iterrows()]
-    if shelters_list:
-        target = min(shelters_list, key=lambda s: haversine_km(origin, (s[0], s[1])))
-        target_coord = (target[0], target[1])
-        target_name = target[2]
-        dist_km = haversine_km(origin, target_coord)
+    # Choose nearest shelter dynamically (vectorized haversine over all shelters)
+    if shelters is not None and not shelters.empty:
+        lats = shelters["lat"].to_numpy(dtype=np.float64)
+        lons = shelters["lon"].to_numpy(dtype=np.float64)
+        olat, olon = map(np.float64, origin)
+        dlat = np.radians(lats - olat)
+        dlon = np.radians(lons - olon)
+        a = np.sin(dlat / 2) ** 2 + np.cos(np.radians(olat)) * np.cos(np.radians(lats)) * np.sin(dlon / 2) ** 2
+        d = 2 * 6371.0 * np.arcsin(np.sqrt(a))
+        idx = int(np.argmin(d))
+        target_coord = (float(lats[idx]), float(lons[idx]))
+        target_name = shelters["name"].iat[idx]
+        dist_km = float(d[idx])
         eta_hours = dist_km / 4.5 if dist_km > 0 else 0.0
         eta_min = int(eta_hours * 60)
     else:
@@ -470,95 +747,10 @@ with left_col:
             route_mode_used = "Grid fallback (offline)"
             st.info("Graph not available. Using straight-line fallback route.")
     
-    # Create base map with enhanced error handling
-    try:
-        # Always create a base map first
-        m = ux.create_base_map(center_point=center_point, zoom_start=15)
-        
-        if m is None:
-            st.error("Failed to create map. Please check your folium installation.")
-        else:
-            # Add hazards if available
-            try:
-                if hazards is not None and not hazards.empty:
-                    ux.add_hazards_to_map(m, hazards)
-            except Exception as e:
-                st.warning(f"Could not add hazards to map: {e}")
-            
-            # Add shelters if available
-            try:
-                if shelters is not None and not shelters.empty:
-                    ux.add_shelters_to_map(m, shelters)
-            except Exception as e:
-                st.warning(f"Could not add shelters to map: {e}")
-            
-            # Add origin point
-            try:
-                ux.add_origin_to_map(m, origin)
-            except Exception as e:
-                st.warning(f"Could not add origin to map: {e}")
-
-            # Add user crowd reports
-            try:
-                ux.add_reports_to_map(m, st.session_state.get("reports", []))
-            except Exception as e:
-                st.warning(f"Could not add reports to map: {e}")
-            
-            # Highlight chosen target shelter
-            try:
-                import folium
-                folium.CircleMarker(
-                    location=target_coord, 
-                    radius=10, 
-                    color="purple",
-                    fill=True, 
-                    fillColor="purple",
-                    popup=folium.Popup(f"<b>Target Shelter</b><br>{target_name}", max_width=200),
-                    tooltip=f"Target: {target_name}"
-                ).add_to(m)
-            except Exception as e:
-                st.warning(f"Could not add target marker: {e}")
-            
-            # Add route if available
-            if route:
-                try:
-                    ux.add_route_to_map(m, route)
-                except Exception as e:
-                    st.warning(f"Could not add route to map: {e}")
-            
-            # Render map in Streamlit - simplified for reliability
-            try:
-                # Try simple st_folium first
-                map_data = st_folium(m, width=700, height=600, key="main_map")
-            except Exception as e:
-                st.error(f"Map rendering error: {str(e)}")
-                # Fallback: try to render with HTML directly
-                try:
-                    import folium
-                    html_str = m._repr_html_()
-                    st.components.v1.html(html_str, width=700, height=600)
-                    st.info("Map rendered using HTML fallback method.")
-                except Exception as e2:
-                    st.error(f"Fallback map rendering failed: {str(e2)}")
-                    # Last resort: create and show minimal map
-                    try:
-                        minimal = folium.Map(location=center_point, zoom_start=15)
-                        st_folium(minimal, width=700, height=600, key="minimal_map")
-                    except:
-                        st.error("Could not display map. Please check your Streamlit and Folium installation.")
-                    
-    except Exception as e:
-        st.error(f"Critical map creation error: {str(e)}")
-        import traceback
-        st.code(traceback.format_exc())
-        # Last resort: create a minimal map
-        try:
-            import folium
-            minimal_map = folium.Map(location=center_point, zoom_start=15)
-            st_folium(minimal_map, width=700, height=600, key="fallback_map")
-            st.info("Displaying minimal map as fallback.")
-        except Exception as e2:
-            st.error(f"Could not create fallback map: {str(e2)}")
+    render_map(
+        center_point, hazards, shelters, origin, route,
+        st.session_state.get("reports", []), target_coord, target_name,
+    )
 
 with right_col:
     # Severity section with animated color badge
@@ -568,7 +760,7 @@ with right_col:
         "High": "#E67E22", 
         "Critical": "#C0392B"
     }
-    st.subheader(i18n["severity"])
+    st.subheader(i18n.severity)
     color = severity_colors.get(severity, "#bdc3c7")
     st.markdown(
         f"<div style='padding:12px;border-radius:8px;background:{color};"
@@ -580,26 +772,17 @@ with right_col:
     st.markdown("---")
     
     # Drivers with icons
-    st.markdown("**" + i18n["drivers"] + ":**")
-    driver_icons = {
-        "rainfall": "🌧️",
-        "wind": "💨",
-        "flood": "🌊",
-        "crowd": "👥",
-        "density": "📊"
-    }
+    st.markdown("**" + i18n.drivers + ":**")
+    # One markdown element for all drivers instead of one st.write each
+    lines = []
     for d in drivers + crowd_drivers:
-        icon = "⚠️"
-        for key, emoji in driver_icons.items():
-            if key.lower() in d.lower():
-                icon = emoji
-                break
-        st.write(f"{icon} {d}")
+        lines.append(f"- {_icon_for(d)} {d}")
+    st.markdown("\n".join(lines))
     
     st.markdown("---")
     
     # Advisory
-    st.subheader(i18n["advisory"])
+    st.subheader(i18n.advisory)
     st.info(advisory_out)
     
     # Play GPS-style TTS in selected language: brief situation + route summary
@@ -628,17 +811,28 @@ with right_col:
             # Translate the full message into the selected UI language
             if lang != "en":
                 try:
-                    tts_text = translate.translate(full_msg_en, dest=lang)
+                    tts_text = _cached_translate(full_msg_en, lang)
                 except Exception:
                     tts_text = advisory_out  # fall back to already translated advisory
             else:
                 tts_text = full_msg_en
 
             tts_lang = lang if lang in ("en", "hi", "ml", "ta") else "en"
-            path = tts.generate_tts(tts_text, lang=tts_lang)
-            if path and path.endswith(".mp3"):
+            try:
+                path = _cached_tts(tts_text, tts_lang)
+            except RuntimeError:
+                path = None
+            fixed_path = None
+            if not path and tts_lang == "en":
+                # Live synthesis failed: speak the prerendered fixed advisory for this tier
+                from src import tts
+                fixed_path = tts.precomputed_advisory(severity)
+            if path:
                 st.audio(path, autoplay=True)
                 st.success(f"🔊 Playing navigation advisory ({tts_lang})")
+            elif fixed_path:
+                st.audio(fixed_path, autoplay=True)
+                st.info("🔊 Playing fixed severity advisory")
             else:
                 st.warning("TTS unavailable. Using text advisory.")
         except Exception as e:
@@ -647,29 +841,31 @@ with right_col:
     st.markdown("---")
     
     # Recommendations
-    st.subheader(i18n["recommendations"])
+    st.subheader(i18n.recommendations)
     for i, r in enumerate(recommendations, 1):
         st.write(f"{i}. {r}")
     
     st.markdown("---")
     
     # Nearest shelter card
-    st.subheader(i18n["nearest"])
+    st.subheader(i18n.nearest)
     st.markdown(f"**{target_name}**")
     col_dist, col_eta = st.columns(2)
     with col_dist:
-        st.metric(i18n["distance"], f"{dist_km:.2f} km")
+        st.metric(i18n.distance, f"{dist_km:.2f} km")
     with col_eta:
-        st.metric(i18n["eta"], f"~{eta_min} min")
+        st.metric(i18n.eta, f"~{eta_min} min")
     
     # Turn-by-turn route instructions
     if route:
         st.markdown("---")
-        st.subheader(i18n["instructions"])
+        st.subheader(i18n.instructions)
         instruction_container = st.container()
         with instruction_container:
-            for i, pt in enumerate(route[:10], 1):  # Limit to first 10 steps
-                st.write(f"📍 Step {i}: ({pt[0]:.5f}, {pt[1]:.5f})")
+            # Limit to first 10 steps, emitted as a single element
+            st.markdown("\n".join(
+                f"📍 Step {i}: ({pt[0]:.5f}, {pt[1]:.5f})  " for i, pt in enumerate(route[:10], 1)
+            ))
             if len(route) > 10:
                 st.caption(f"... and {len(route) - 10} more steps")
         st.caption(f"Mode: {route_mode_used}")
@@ -687,9 +883,9 @@ with right_col:
     st.markdown("---")
     
     # Risk scores with animated progress bars
-    st.subheader(i18n["risk_crowd"])
+    st.subheader(i18n.risk_crowd)
     st.progress(min(1.0, max(0.0, crowd_score)), text=f"{crowd_score*100:.1f}%")
-    st.subheader(i18n["risk_disaster"])
+    st.subheader(i18n.risk_disaster)
     st.progress(min(1.0, max(0.0, disaster_score)), text=f"{disaster_score*100:.1f}%")
 
     # Authority-specific panel: recent reports & auto-alerts when risk is high
@@ -729,72 +925,23 @@ with right_col:
                     st.warning(f"⚠️ SMS status: {msg}")
 
 # -------- Interactive Charts Section --------
-if show_charts and st.session_state.risk_history:
+if show_charts and len(st.session_state.risk_history):
     st.markdown("---")
-    st.subheader(i18n.get("history", "Risk History"))
+    st.subheader(i18n.history)
+    import plotly.graph_objects as go
     
     chart_col1, chart_col2 = st.columns(2)
     
     with chart_col1:
         # Time series chart
-        df_history = pd.DataFrame(st.session_state.risk_history)
-        if not df_history.empty:
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(
-                x=df_history["timestamp"],
-                y=df_history["disaster_score"],
-                mode='lines+markers',
-                name='Disaster Risk',
-                line=dict(color='#E67E22', width=2)
-            ))
-            fig.add_trace(go.Scatter(
-                x=df_history["timestamp"],
-                y=df_history["crowd_score"],
-                mode='lines+markers',
-                name='Crowd Risk',
-                line=dict(color='#3498DB', width=2)
-            ))
-            fig.add_trace(go.Scatter(
-                x=df_history["timestamp"],
-                y=df_history["combined"],
-                mode='lines+markers',
-                name='Combined Risk',
-                line=dict(color='#E74C3C', width=3)
-            ))
-            fig.update_layout(
-                title="Risk Scores Over Time",
-                xaxis_title="Time",
-                yaxis_title="Risk Score (0-1)",
-                hovermode='x unified',
-                height=300
-            )
+        if len(st.session_state.risk_history):
+            fig = build_history_fig(st.session_state.risk_history.to_df())
             st.plotly_chart(fig, width="stretch")
     
     with chart_col2:
         # Current conditions gauge
-        fig = go.Figure(go.Indicator(
-            mode="gauge+number+delta",
-            value=disaster_score * 100,
-            domain={'x': [0, 1], 'y': [0, 1]},
-            title={'text': "Disaster Risk Level"},
-            delta={'reference': 50},
-            gauge={
-                'axis': {'range': [None, 100]},
-                'bar': {'color': color},
-                'steps': [
-                    {'range': [0, 25], 'color': "#2ECC71"},
-                    {'range': [25, 50], 'color': "#F5B041"},
-                    {'range': [50, 75], 'color': "#E67E22"},
-                    {'range': [75, 100], 'color': "#C0392B"}
-                ],
-                'threshold': {
-                    'line': {'color': "red", 'width': 4},
-                    'thickness': 0.75,
-                    'value': 90
-                }
-            }
-        ))
-        fig.update_layout(height=300)
+        # 21 buckets x 5 severity colours cover every gauge the app can show
+        fig = go.Figure(gauge_fig(int(round(disaster_score * 20)), color))
         st.plotly_chart(fig, width="stretch")
     
     # Risk distribution pie chart
@@ -805,7 +952,6 @@ if show_charts and st.session_state.risk_history:
     with risk_col2:
         st.metric("Crowd Risk", f"{crowd_score*100:.1f}%", delta=f"{crowd_score*100:.1f}%")
     with risk_col3:
-        combined_risk = max(disaster_score, crowd_score * 0.9)
         st.metric("Combined Risk", f"{combined_risk*100:.1f}%", delta=f"{combined_risk*100:.1f}%")
 
     # High-level KPIs for demo / authority view
@@ -816,16 +962,15 @@ if show_charts and st.session_state.risk_history:
     with kpi_col2:
         st.metric("Last Severity", severity)
     with kpi_col3:
-        if st.session_state.risk_history:
-            last10 = pd.DataFrame(st.session_state.risk_history[-10:])
-            avg_combined = last10["combined"].mean() * 100
-            st.metric("Avg Combined Risk (last 10)", f"{avg_combined:.1f}%")
+        avg_combined = st.session_state.risk_history.last_avg(10)
+        if avg_combined is not None:
+            st.metric("Avg Combined Risk (last 10)", f"{avg_combined * 100:.1f}%")
         else:
             st.metric("Avg Combined Risk (last 10)", "N/A")
 
 # -------- Safety methods --------
 st.markdown("---")
-st.subheader(i18n.get("safety_methods", "Safety methods"))
+st.subheader(i18n.safety_methods)
 safety_tips = [
     "🏔️ Move to higher ground and avoid flood-prone areas",
     "🚫 Do not walk or drive through floodwaters",
@@ -15,6 +15,8 @@ __all__ = [
     "ux",
     "risk_disaster",
     "risk_crowd",
-    "tts"
+    "tts",
+    "constants",
+    "risk_history"
 ]
 
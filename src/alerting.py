@@ -3,6 +3,7 @@ Twilio SMS sender with multilingual fallback.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -11,14 +12,21 @@ TWILIO_SID = os.getenv("TWILIO_ACCOUNT_SID")
 TWILIO_TOKEN = os.getenv("TWILIO_AUTH_TOKEN")
 TWILIO_FROM = os.getenv("TWILIO_FROM_NUMBER")
 
+@lru_cache(maxsize=1)
+def _twilio_client(sid, token):
+    """
+    Reuse one Twilio client (and its HTTP session) per process.
+    """
+    from twilio.rest import Client
+    return Client(sid, token)
+
 def send_sms(message, to_number, lang="en"):
     """
     Send SMS in selected language. Falls back to file mock if Twilio not configured.
     """
     if TWILIO_SID and TWILIO_TOKEN and TWILIO_FROM:
         try:
-            from twilio.rest import Client
-            client = Client(TWILIO_SID, TWILIO_TOKEN)
+            client = _twilio_client(TWILIO_SID, TWILIO_TOKEN)
             msg = client.messages.create(body=message, from_=TWILIO_FROM, to=to_number)
             return {"status":"sent","sid":msg.sid}
         except Exception as e:
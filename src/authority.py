@@ -4,6 +4,13 @@ Authority micro-playbook with dispatch simulation and ETA overlay.
 import math
 from datetime import timedelta
 
+import numpy as np
+
+try:
+    from numba import njit, prange  # type: ignore
+except Exception:
+    njit = None  # type: ignore
+
 PLAYBOOKS = {
     "Local Authority": ["Issue public advisory", "Activate shelters", "Coordinate transport"],
     "First Responder": ["Dispatch ground team", "Prepare medical aid", "Coordinate with command"],
@@ -31,4 +38,58 @@ def dispatch(role, origin, target, G):
     eta_seconds = dist_m / speed if speed > 0 else None
     eta = timedelta(seconds=int(eta_seconds)) if eta_seconds else None
     marker = {"role": role, "origin": origin, "target": target, "eta": str(eta), "distance_m": int(dist_m)}
-    return {"actions": actions, "marker": marker}
\ No newline at end of file
+    return {"actions": actions, "marker": marker}
+
+def _haversine_np(lat1, lon1, lat2, lon2):
+    """
+    Great-circle distance in meters between flat float64 arrays of degrees.
+    """
+    R = 6371000
+    phi1 = np.radians(lat1); phi2 = np.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = np.radians(lon2 - lon1)
+    a = np.sin(dphi/2)**2 + np.cos(phi1)*np.cos(phi2)*np.sin(dlambda/2)**2
+    c = 2*np.arctan2(np.sqrt(a), np.sqrt(1-a))
+    return R*c
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _haversine_nb(lat1, lon1, lat2, lon2):
+        n = lat1.shape[0]
+        out = np.empty(n, dtype=np.float64)
+        deg = math.pi / 180.0
+        for i in prange(n):
+            phi1 = lat1[i]*deg; phi2 = lat2[i]*deg
+            dphi = phi2 - phi1
+            dlambda = (lon2[i] - lon1[i])*deg
+            a = math.sin(dphi/2)**2 + math.cos(phi1)*math.cos(phi2)*math.sin(dlambda/2)**2
+            out[i] = 6371000*2*math.atan2(math.sqrt(a), math.sqrt(1-a))
+        return out
+    _haversine = _haversine_nb
+else:
+    _haversine = _haversine_np
+
+def dispatch_batch(roles, origins, targets):
+    """
+    Vectorized dispatch for many responders at once.
+    roles is a sequence of role names; origins/targets are (N,2) arrays of (lat,lon).
+    Returns a list of dicts shaped like dispatch().
+    """
+    origins = np.asarray(origins, dtype=np.float64).reshape(-1, 2)
+    targets = np.asarray(targets, dtype=np.float64).reshape(-1, 2)
+    lat1, lon1 = np.ascontiguousarray(origins[:, 0]), np.ascontiguousarray(origins[:, 1])
+    lat2, lon2 = np.ascontiguousarray(targets[:, 0]), np.ascontiguousarray(targets[:, 1])
+    try:
+        dist_m = _haversine(lat1, lon1, lat2, lon2)
+    except Exception:
+        dist_m = _haversine_np(lat1, lon1, lat2, lon2)
+    # same responder speed as dispatch(): 15 km/h => 4.166 m/s
+    speed = 4.166
+    eta_seconds = dist_m / speed
+    results = []
+    for role, o, t, d, s in zip(roles, origins.tolist(), targets.tolist(), dist_m.astype(np.int64).tolist(),
+                                eta_seconds.tolist()):
+        eta = timedelta(seconds=int(s)) if s else None
+        marker = {"role": role, "origin": tuple(o), "target": tuple(t), "eta": str(eta), "distance_m": d}
+        results.append({"actions": PLAYBOOKS.get(role, PLAYBOOKS["Local Authority"]), "marker": marker})
+    return results
\ No newline at end of file
@@ -0,0 +1,87 @@
+"""
+Static UI constants: multilingual labels and supported states.
+
+Kept out of app.py so they are built once per process rather than on
+every Streamlit script rerun.
+"""
+
+from types import SimpleNamespace
+
+# -------- Multilingual dictionary --------
+I18N = {
+    "en": {
+        "title": "CrowdShield Demo", "state": "Select state", "map": "Safety Map",
+        "drivers": "Drivers", "severity": "Severity Tier", "advisory": "LLM Advisory",
+        "risk_crowd": "Crowd risk", "risk_disaster": "Disaster risk",
+        "recommendations": "Recommendations", "nearest": "Nearest shelter",
+        "eta": "ETA", "distance": "Distance", "instructions": "Route instructions",
+        "safety_methods": "Safety methods", "live_status": "Live Status",
+        "refresh_rate": "Auto-refresh (seconds)", "enable_auto_refresh": "Enable Auto-Refresh",
+        "real_time_data": "Real-time Data", "history": "Risk History",
+        "current_conditions": "Current Conditions", "alerts_active": "Active Alerts"
+    },
+    "hi": {
+        "title": "क्राउडशील्ड डेमो", "state": "राज्य चुनें", "map": "सुरक्षा मानचित्र",
+        "drivers": "ड्राइवर्स", "severity": "गंभीरता स्तर", "advisory": "एलएलएम सलाह",
+        "risk_crowd": "भीड़ जोखिम", "risk_disaster": "आपदा जोखिम",
+        "recommendations": "सिफारिशें", "nearest": "निकटतम शेल्टर",
+        "eta": "अनुमानित समय", "distance": "दूरी", "instructions": "रूट निर्देश",
+        "safety_methods": "सुरक्षा उपाय", "live_status": "लाइव स्थिति",
+        "refresh_rate": "ऑटो-रिफ्रेश (सेकंड)", "enable_auto_refresh": "ऑटो-रिफ्रेश सक्षम करें",
+        "real_time_data": "रीयल-टाइम डेटा", "history": "जोखिम इतिहास",
+        "current_conditions": "वर्तमान स्थितियां", "alerts_active": "सक्रिय अलर्ट"
+    },
+    "ml": {
+        "title": "ക്രൗഡ്‌ഷീൽഡ് ഡെമോ", "state": "സംസ്ഥാനം തിരഞ്ഞെടുക്കുക", "map": "സുരക്ഷാ മാപ്പ്",
+        "drivers": "ഡ്രൈവർസ്", "severity": "ഗൗരവത്വം", "advisory": "എൽഎൽഎം ഉപദേശം",
+        "risk_crowd": "ജനക്കൂട്ട അപകടം", "risk_disaster": "ദുരന്ത അപകടം",
+        "recommendations": "ശുപാർശകൾ", "nearest": "അടുത്ത അഭയം",
+        "eta": "എത്താൻ വേണ്ട സമയം", "distance": "ദൂരം", "instructions": "റൂട്ടു നിർദ്ദേശങ്ങൾ",
+        "safety_methods": "സുരക്ഷാ രീതികൾ", "live_status": "ലൈവ് സ്ഥിതി",
+        "refresh_rate": "ഓട്ടോ-റിഫ്രഷ് (സെക്കൻഡ്)", "enable_auto_refresh": "ഓട്ടോ-റിഫ്രഷ് പ്രവർത്തനക്ഷമമാക്കുക",
+        "real_time_data": "റിയൽ-ടൈം ഡാറ്റ", "history": "റിസ്ക് ചരിത്രം",
+        "current_conditions": "നിലവിലെ വ്യവസ്ഥകൾ", "alerts_active": "സജീവമായ അലേർട്ടുകൾ"
+    },
+    "ta": {
+        "title": "கூட்டம் பாதுகாப்பு டெமோ", "state": "மாநிலத்தைத் தேர்ந்தெடுக்கவும்", "map": "பாதுகாப்பு வரைபடம்",
+        "drivers": "டிரைவர்கள்", "severity": "தீவிர நிலை", "advisory": "LLM ஆலோசனை",
+        "risk_crowd": "கூட்டம் அபாயம்", "risk_disaster": "பேரழிவு அபாயம்",
+        "recommendations": "பரிந்துரைகள்", "nearest": "அருகிலுள்ள தங்குமிடம்",
+        "eta": "வருகை நேரம்", "distance": "தூரம்", "instructions": "பாதை வழிமுறைகள்",
+        "safety_methods": "பாதுகாப்பு முறைகள்", "live_status": "நேரடி நிலை",
+        "refresh_rate": "ஆட்டோ-ரெஃப்ரெஷ் (விநாடிகள்)", "enable_auto_refresh": "ஆட்டோ-ரெஃப்ரெஷ் இயக்கு",
+        "real_time_data": "நேரடி தரவு", "history": "ஆபத்து வரலாறு",
+        "current_conditions": "தற்போதைய நிலைமைகள்", "alerts_active": "செயலில் உள்ள அலாரங்கள்"
+    }
+}
+
+# Per-language labels as attribute namespaces (i18n.map instead of a dict lookup)
+I18N_NS = {lng: SimpleNamespace(**d) for lng, d in I18N.items()}
+
+STATES = [
+    "Kerala", "Tamil Nadu", "Karnataka", "Maharashtra",
+    "Uttar Pradesh", "Delhi", "West Bengal", "Rajasthan"
+]
+
+# Approximate map centres for supported states so the map pans
+# to the selected region instead of always showing Kochi.
+STATE_CENTERS = {
+    "Kerala": (10.1632, 76.6413),
+    "Tamil Nadu": (11.1271, 78.6569),
+    "Karnataka": (15.3173, 75.7139),
+    "Maharashtra": (19.7515, 75.7139),
+    "Uttar Pradesh": (26.8467, 80.9462),
+    "Delhi": (28.6139, 77.2090),
+    "West Bengal": (22.9868, 87.8550),
+    "Rajasthan": (27.0238, 74.2179),
+}
+
+# Per-state data file paths: (hazards geojson, shelters csv, crowd csv)
+STATE_PATHS = {
+    s: (
+        f"data/hazard_zones_{slug}.geojson",
+        f"data/safe_zones_{slug}.csv",
+        f"data/crowd_sim_{slug}.csv",
+    )
+    for s, slug in ((s, s.lower().replace(" ", "_")) for s in STATES)
+}
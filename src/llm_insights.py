@@ -3,6 +3,10 @@ LLM advisory generator with OpenAI integration and cached fallback.
 """
 import os
 import json
+import sqlite3
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
 
 try:
@@ -17,17 +21,94 @@ try:
 except Exception:
     openai = None  # type: ignore
 
-CACHE_PATH = Path("data/cached_advisories.json")
-LOCAL_CACHE = {}
+CACHE_PATH = Path("data/cached_advisories.json")  # legacy seed, read once
+DB_PATH = Path("data/cached_advisories.sqlite")
 OPENAI_DISABLED = False  # set to True if we detect quota or other hard failure
-if CACHE_PATH.exists():
-    with open(CACHE_PATH) as f:
-        LOCAL_CACHE = json.load(f)
+OPENAI_TIMEOUT = 5.0  # seconds; a slow API must not freeze the Streamlit script thread
+_DB_LOCK = threading.Lock()
+ADVISORY_TTL = 120.0  # seconds an in-process advisory is reused; same as app.py's cache
+_MEMO_MAX = 128
+_memo = {}  # (severity, sorted drivers, role) -> (expires_at, text)
+
+@lru_cache(maxsize=1)
+def _cache_db():
+    """
+    Keyed advisory store. Each new advisory is a single atomic upsert instead
+    of re-dumping the whole JSON file; seeded from the legacy JSON on creation.
+    """
+    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    with _DB_LOCK, conn:
+        conn.execute("CREATE TABLE IF NOT EXISTS advisories (severity TEXT PRIMARY KEY, text TEXT)")
+        empty = conn.execute("SELECT COUNT(*) FROM advisories").fetchone()[0] == 0
+        if empty and CACHE_PATH.exists():
+            try:
+                with open(CACHE_PATH) as f:
+                    seed = json.load(f)
+                conn.executemany("INSERT OR IGNORE INTO advisories VALUES (?, ?)", seed.items())
+            except Exception as e:
+                print("Error seeding advisory cache:", e)
+    return conn
+
+def _cached_text(severity):
+    """
+    Stored advisory for severity, or the generic fallback sentence.
+    """
+    try:
+        conn = _cache_db()
+        with _DB_LOCK:
+            row = conn.execute("SELECT text FROM advisories WHERE severity=?", (severity,)).fetchone()
+        if row:
+            return row[0]
+    except Exception as e:
+        print("Advisory cache read failed:", e)
+    return f"{severity} advisory: follow local instructions."
+
+def _store_text(severity, text):
+    try:
+        conn = _cache_db()
+        with _DB_LOCK, conn:
+            conn.execute("INSERT OR REPLACE INTO advisories (severity, text) VALUES (?, ?)", (severity, text))
+    except Exception as e:
+        print("Advisory cache write failed:", e)
+
+@lru_cache(maxsize=4)
+def _openai_client(key):
+    """
+    One client per API key, so its HTTP connection pool is reused across calls.
+    Retries are off so OPENAI_TIMEOUT bounds the whole call, not each attempt.
+    """
+    return OpenAI(api_key=key, max_retries=0)
+
+class _TransientFallback(Exception):
+    """
+    Raised on a failed API call so its fallback text is not memoized.
+    """
+    def __init__(self, text):
+        super().__init__(text)
+        self.text = text
 
 def generate_advisory(severity, top_drivers, role="Local Authority"):
     """
     If OPENAI_API_KEY present, use OpenAI; otherwise return cached advisory.
+    Results are memoized in-process for ADVISORY_TTL per (severity, set of
+    drivers, role); the prompt keeps the drivers in their given order.
     """
+    memo_key = (severity, tuple(sorted(top_drivers)), role)
+    now = time.monotonic()
+    hit = _memo.get(memo_key)
+    if hit is not None and hit[0] > now:
+        return hit[1]
+    try:
+        text = _generate_advisory(severity, tuple(top_drivers), role)
+    except _TransientFallback as fb:
+        return fb.text
+    if len(_memo) >= _MEMO_MAX:
+        _memo.clear()
+    _memo[memo_key] = (now + ADVISORY_TTL, text)
+    return text
+
+def _generate_advisory(severity, top_drivers, role):
     global OPENAI_DISABLED
 
     key = os.getenv("OPENAI_API_KEY")
@@ -36,7 +117,7 @@ def generate_advisory(severity, top_drivers, role="Local Authority"):
     # If we've previously detected a hard error (e.g. insufficient_quota),
     # skip calling the API again and immediately return cached/fallback text.
     if OPENAI_DISABLED:
-        return LOCAL_CACHE.get(severity, f"{severity} advisory: follow local instructions.")
+        return _cached_text(severity)
 
     if key and (OpenAI or openai):
         try:
@@ -44,29 +125,30 @@ def generate_advisory(severity, top_drivers, role="Local Authority"):
 
             # Prefer the new client if available
             if OpenAI is not None:
-                client = OpenAI(api_key=key)
+                client = _openai_client(key)
                 resp = client.chat.completions.create(
                     model="gpt-3.5-turbo",
                     messages=[{"role": "user", "content": prompt}],
                     max_tokens=150,
+                    timeout=OPENAI_TIMEOUT,
                 )
                 text = resp.choices[0].message.content.strip()
 
             # Fallback to legacy client, if installed
             elif openai is not None:
-                openai.api_key = key
+                if openai.api_key != key:
+                    openai.api_key = key
                 resp = openai.ChatCompletion.create(
                     model="gpt-3.5-turbo",
                     messages=[{"role": "user", "content": prompt}],
                     max_tokens=150,
+                    request_timeout=OPENAI_TIMEOUT,
                 )
                 text = resp["choices"][0]["message"]["content"].strip()
 
             if text:
                 # cache it
-                LOCAL_CACHE[severity] = text
-                with open(CACHE_PATH, "w") as f:
-                    json.dump(LOCAL_CACHE, f, indent=2)
+                _store_text(severity, text)
                 return text
         except Exception as e:
             # If quota is exceeded or another hard error occurs, disable
@@ -74,6 +156,9 @@ def generate_advisory(severity, top_drivers, role="Local Authority"):
             msg = str(e)
             if "insufficient_quota" in msg or "quota" in msg:
                 OPENAI_DISABLED = True
+                _memo.clear()
             print("OpenAI call failed:", e)
+        # the API was reachable in principle; let the next call retry
+        raise _TransientFallback(_cached_text(severity))
     # fallback
-    return LOCAL_CACHE.get(severity, f"{severity} advisory: follow local instructions.")
\ No newline at end of file
+    return _cached_text(severity)
@@ -2,12 +2,60 @@
 Crowd risk estimation using density heuristics with multilingual support.
 """
 
+import numpy as np
 import pandas as pd
 import yaml
 from pathlib import Path
 
+try:
+    from numba import njit  # type: ignore
+except Exception:
+    njit = None  # type: ignore
+
 CONFIG = Path("configs/thresholds.yaml")
 
+def _level(total, area_m2, trigger, medium, high):
+    """
+    Returns (total_people, density, level) where level is 0=low, 1=medium, 2=high.
+    """
+    density = int(total) / area_m2
+    if trigger or density >= high:
+        level = 2
+    elif density >= medium:
+        level = 1
+    else:
+        level = 0
+    return total, density, level
+
+def _score_crowd_py(people, area_m2, trigger, medium, high):
+    """
+    Numeric core of score_crowd. Missing (NaN) and infinite counts are
+    skipped, as pandas' sum skips NaN.
+    """
+    total = float(np.nansum(people[~np.isinf(people)]))
+    return _level(total, area_m2, trigger, medium, high)
+
+if njit is not None:
+    _level_nb = njit(cache=True)(_level)
+
+    def _score_crowd_loop(people, area_m2, trigger, medium, high):
+        total = 0.0
+        for i in range(people.shape[0]):
+            x = people[i]
+            if np.isfinite(x):
+                total += x
+        return _level_nb(total, area_m2, trigger, medium, high)
+
+    # No fastmath: it would let the compiler assume away the isfinite check.
+    _score_crowd_nb = njit(cache=True)(_score_crowd_loop)
+    # Warm the JIT at import so the first rerun isn't stalled by compilation.
+    try:
+        _score_crowd_nb(np.zeros(1, dtype=np.float64), 1000.0, False, 2.0, 4.0)
+    except Exception:
+        _score_crowd_nb = _score_crowd_py
+else:
+    _score_crowd_nb = _score_crowd_py
+
 def _load_thresholds():
     try:
         with open(CONFIG, encoding="utf-8") as f:
@@ -29,8 +77,15 @@ def score_crowd(crowd_df, trigger_surge=False, area_m2=1000.0, i18n=None):
     if "people" not in crowd_df.columns:
         return 0.0, [i18n.get("missing_people", "Missing 'people' column") if i18n else "Missing 'people' column"]
 
-    total_people = int(crowd_df["people"].sum())
-    density = total_people / area_m2
+    people = crowd_df["people"].to_numpy(np.float64)
+    total, density, level = _score_crowd_nb(
+        people,
+        float(area_m2),
+        bool(trigger_surge),
+        float(t["crowd_density_per_m2"]["medium"]),
+        float(t["crowd_density_per_m2"]["high"]),
+    )
+    total_people = int(total)
 
     drivers = [
         f"{i18n.get('density','Density') if i18n else 'Density'}: {density:.2f} ppl/m2",
@@ -38,10 +93,10 @@ def score_crowd(crowd_df, trigger_surge=False, area_m2=1000.0, i18n=None):
     ]
 
     score = 0.0
-    if trigger_surge or density >= t["crowd_density_per_m2"]["high"]:
+    if level == 2:
         score = 0.7
         drivers.append(i18n.get("high", "High density") if i18n else "High density")
-    elif density >= t["crowd_density_per_m2"]["medium"]:
+    elif level == 1:
         score = 0.35
         drivers.append(i18n.get("medium", "Moderate density") if i18n else "Moderate density")
     else:
@@ -0,0 +1,68 @@
+"""
+Risk score history stored as a struct of NumPy arrays.
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+
+class RiskHistory:
+    """
+    Bounded risk history: one preallocated array per column (timestamp,
+    disaster, crowd, combined) written in place as a ring, instead of a
+    list of dicts that has to be re-sliced and re-framed on every rerun.
+    """
+
+    def __init__(self, maxlen=50):
+        self.maxlen = maxlen
+        self.ts = np.empty(maxlen, dtype="datetime64[ms]")
+        self.d = np.empty(maxlen, dtype=np.float64)
+        self.c = np.empty(maxlen, dtype=np.float64)
+        self.comb = np.empty(maxlen, dtype=np.float64)
+        self.i = 0  # total appends; next write goes to i % maxlen
+        self.n = 0  # number of valid points
+
+    def __len__(self):
+        return self.n
+
+    def append(self, disaster, crowd, combined, ts=None):
+        j = self.i % self.maxlen
+        self.ts[j] = np.datetime64(ts or datetime.now(), "ms")
+        self.d[j] = disaster
+        self.c[j] = crowd
+        self.comb[j] = combined
+        self.i += 1
+        self.n = min(self.n + 1, self.maxlen)
+
+    def _order(self, last=None):
+        """
+        Slice (no copy) while the ring has not wrapped, else oldest-first indices.
+        """
+        if self.n < self.maxlen:
+            start = 0 if last is None else max(0, self.n - last)
+            return slice(start, self.n)
+        order = (np.arange(self.n) + self.i) % self.maxlen
+        return order[-last:] if last is not None else order
+
+    def last_avg(self, last=10):
+        """
+        Mean combined risk over the most recent points, or None if empty.
+        """
+        if not self.n:
+            return None
+        return float(self.comb[self._order(last)].mean())
+
+    def to_df(self, last=None):
+        """
+        DataFrame of the history oldest first; backed by views of the arrays
+        until the ring wraps.
+        """
+        o = self._order(last)
+        return pd.DataFrame({
+            "timestamp": self.ts[o],
+            "disaster_score": self.d[o],
+            "crowd_score": self.c[o],
+            "combined": self.comb[o],
+        }, copy=False)
@@ -1,6 +1,20 @@
 import networkx as nx
 import osmnx as ox
 import os
+from functools import lru_cache
+
+import geopandas as gpd
+import numpy as np
+import streamlit as st
+
+try:
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import dijkstra
+    from scipy.spatial import cKDTree
+except Exception:
+    csr_matrix = None
+    dijkstra = None
+    cKDTree = None
 
 def load_graph(online=True, center_point=(9.9312,76.2673), dist=2000):
     """
@@ -21,18 +35,156 @@ def load_graph(online=True, center_point=(9.9312,76.2673), dist=2000):
         print(f"Graph loading error: {e}")
         return None
 
+def get_graph(online=True, center_point=(9.9312,76.2673), dist=2000):
+    """
+    Cached load_graph: the graph is static for a given centre, so it is
+    built once per process and shared across Streamlit reruns.
+    Returns None on failure; failures are retried on the next call.
+    """
+    try:
+        return _cached_graph(online, tuple(center_point), dist)
+    except LookupError:
+        return None
+
+@st.cache_resource(show_spinner=False)
+def _cached_graph(online, center_point, dist):
+    G = load_graph(online=online, center_point=center_point, dist=dist)
+    if G is None:
+        # raise so Streamlit does not cache the miss
+        raise LookupError("road graph unavailable")
+    return G
+
+@lru_cache(maxsize=32)
+def _annotate_weights(G):
+    """
+    Store "time" and "safe_weight" on every edge, once per graph object.
+    Blocked graphs are separate copies, so each hazard set gets its own pass.
+    """
+    for u,v,k,data in G.edges(keys=True, data=True):
+        # weight by travel time (length / speed)
+        speed = data.get("speed_kph", 30)
+        if "length" in data and speed > 0:
+            data["time"] = data["length"] / (speed*1000/3600)
+        else:
+            data["time"] = data.get("length", 100) / 10  # Default fallback
+        # weight by hazard penalty
+        hazard_penalty = data.get("hazard_penalty", 0)
+        length = data.get("length", 100)
+        data["safe_weight"] = length * (1 + hazard_penalty)
+    return True
+
+@lru_cache(maxsize=32)
+def _node_index(G):
+    """
+    Integer index for every node: (list of node ids, {node id: index}).
+    """
+    nodes = list(G.nodes)
+    return nodes, {n: i for i, n in enumerate(nodes)}
+
+@lru_cache(maxsize=64)
+def _weights_csr(G, weight):
+    """
+    CSR adjacency matrix of G for one edge attribute. Parallel edges keep the
+    smallest weight and non-finite weights (blocked edges) are dropped.
+    """
+    nodes, index = _node_index(G)
+    rows, cols, vals = [], [], []
+    for u, v, data in G.edges(data=True):
+        rows.append(index[u])
+        cols.append(index[v])
+        vals.append(data.get(weight, 1))
+    rows = np.asarray(rows, dtype=np.int64)
+    cols = np.asarray(cols, dtype=np.int64)
+    vals = np.asarray(vals, dtype=np.float64)
+    keep = np.isfinite(vals)
+    rows, cols, vals = rows[keep], cols[keep], vals[keep]
+    # sort by (row, col, weight) and keep the first (cheapest) of each pair
+    order = np.lexsort((vals, cols, rows))
+    rows, cols, vals = rows[order], cols[order], vals[order]
+    first = np.ones(len(rows), dtype=bool)
+    first[1:] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])
+    # explicit tiny weight so zero-length edges are not read as missing
+    vals = np.maximum(vals[first], 1e-9)
+    n = len(nodes)
+    return csr_matrix((vals, (rows[first], cols[first])), shape=(n, n))
+
+def _unit_xyz(lat, lon):
+    """
+    Lat/lon degrees to points on the unit sphere; chord length between them
+    orders exactly like great-circle distance.
+    """
+    phi = np.radians(lat)
+    lam = np.radians(lon)
+    return np.column_stack((np.cos(phi)*np.cos(lam), np.cos(phi)*np.sin(lam), np.sin(phi)))
+
+@lru_cache(maxsize=32)
+def _node_tree(G):
+    """
+    KD-tree over node coordinates, built once per graph: (node ids, tree).
+    """
+    ids, ys, xs = [], [], []
+    for n, d in G.nodes(data=True):
+        ids.append(n)
+        ys.append(d["y"])
+        xs.append(d["x"])
+    return ids, cKDTree(_unit_xyz(np.asarray(ys, dtype=np.float64), np.asarray(xs, dtype=np.float64)))
+
+def _nearest_node(G, point):
+    """
+    Graph node closest to a (lat,lon) point, via the cached KD-tree.
+    """
+    if cKDTree is None or G.number_of_nodes() == 0:
+        return ox.nearest_nodes(G, point[1], point[0]) if hasattr(ox, 'nearest_nodes') else point
+    ids, tree = _node_tree(G)
+    _, idx = tree.query(_unit_xyz(np.array([point[0]]), np.array([point[1]]))[0], k=1)
+    return ids[int(idx)]
+
+def _shortest_node_path(G, origin_node, target_node, weight):
+    """
+    Dijkstra over the cached CSR matrix (scipy, in C); falls back to
+    networkx when scipy is unavailable.
+    """
+    if dijkstra is None:
+        return nx.shortest_path(G, origin_node, target_node, weight=weight)
+    nodes, index = _node_index(G)
+    source = index[origin_node]
+    target_i = index[target_node]
+    _, pred = dijkstra(_weights_csr(G, weight), directed=True, indices=source, return_predecessors=True)
+    if source != target_i and pred[target_i] < 0:
+        raise nx.NetworkXNoPath(f"No path between {origin_node} and {target_node}")
+    path = [target_i]
+    while path[-1] != source:
+        path.append(pred[path[-1]])
+    return [nodes[i] for i in reversed(path)]
+
+@lru_cache(maxsize=8)
+def _edges_gdf(G):
+    """
+    Edge geometries of G as a GeoDataFrame indexed by (u, v, key), built once per graph.
+    """
+    return ox.graph_to_gdfs(G, nodes=False)[["geometry"]]
+
 def block_edges_by_hazards(G, hazards_gdf):
     """
     Block edges intersecting hazard polygons. Returns graph copy.
+    Uses a spatial join (STRtree index) instead of testing every
+    edge/polygon pair; blocked edges get an infinite length.
     """
     if G is None:
         return None
     if hazards_gdf is None or hazards_gdf.empty:
         return G
     try:
+        edges = _edges_gdf(G)
+        hazards = hazards_gdf[["geometry"]]
+        if hazards.crs is None:
+            hazards = hazards.set_crs(edges.crs)
+        elif edges.crs is not None and hazards.crs != edges.crs:
+            hazards = hazards.to_crs(edges.crs)
+        hit = gpd.sjoin(edges, hazards, predicate="intersects", how="inner")
         G_blocked = G.copy()
-        # TODO: implement hazard intersection logic
-        # For now, just return a copy
+        for u, v, k in hit.index.unique():
+            G_blocked[u][v][k]["length"] = float("inf")
         return G_blocked
     except Exception as e:
         print(f"Block edges error: {e}")
@@ -46,10 +198,10 @@ def compute_shortest_path(G, origin, target, weight="length"):
         return None
     try:
         # Find nearest nodes if origin/target are not in graph
-        origin_node = ox.nearest_nodes(G, origin[1], origin[0]) if hasattr(ox, 'nearest_nodes') else origin
-        target_node = ox.nearest_nodes(G, target[1], target[0]) if hasattr(ox, 'nearest_nodes') else target
+        origin_node = _nearest_node(G, origin)
+        target_node = _nearest_node(G, target)
         
-        path = nx.shortest_path(G, origin_node, target_node, weight=weight)
+        path = _shortest_node_path(G, origin_node, target_node, weight)
         # Convert nodes to coordinates
         if isinstance(path[0], (int, tuple)):
             coords = []
@@ -74,18 +226,12 @@ def compute_fastest_path(G, origin, target):
     if G is None:
         return None
     try:
-        # weight by travel time (length / speed)
-        for u,v,k,data in G.edges(keys=True, data=True):
-            speed = data.get("speed_kph", 30)
-            if "length" in data and speed > 0:
-                data["time"] = data["length"] / (speed*1000/3600)
-            else:
-                data["time"] = data.get("length", 100) / 10  # Default fallback
+        _annotate_weights(G)
         
-        origin_node = ox.nearest_nodes(G, origin[1], origin[0]) if hasattr(ox, 'nearest_nodes') else origin
-        target_node = ox.nearest_nodes(G, target[1], target[0]) if hasattr(ox, 'nearest_nodes') else target
+        origin_node = _nearest_node(G, origin)
+        target_node = _nearest_node(G, target)
         
-        path = nx.shortest_path(G, origin_node, target_node, weight="time")
+        path = _shortest_node_path(G, origin_node, target_node, "time")
         # Convert nodes to coordinates similar to shortest_path
         if isinstance(path[0], (int, tuple)):
             coords = []
@@ -110,16 +256,12 @@ def compute_safest_path(G, origin, target, hazards=None):
     if G is None:
         return None
     try:
-        # weight by hazard penalty
-        for u,v,k,data in G.edges(keys=True, data=True):
-            hazard_penalty = data.get("hazard_penalty", 0)
-            length = data.get("length", 100)
-            data["safe_weight"] = length * (1 + hazard_penalty)
+        _annotate_weights(G)
         
-        origin_node = ox.nearest_nodes(G, origin[1], origin[0]) if hasattr(ox, 'nearest_nodes') else origin
-        target_node = ox.nearest_nodes(G, target[1], target[0]) if hasattr(ox, 'nearest_nodes') else target
+        origin_node = _nearest_node(G, origin)
+        target_node = _nearest_node(G, target)
         
-        path = nx.shortest_path(G, origin_node, target_node, weight="safe_weight")
+        path = _shortest_node_path(G, origin_node, target_node, "safe_weight")
         # Convert nodes to coordinates
         if isinstance(path[0], (int, tuple)):
             coords = []
@@ -4,15 +4,29 @@ Satellite simulator that stages uplink events for offline alerting.
 import time
 from datetime import datetime, timedelta
 
+def _events(now):
+    return [
+        {"time": now.isoformat(), "status":"queued", "note":"Queued for uplink"},
+        {"time": (now + timedelta(seconds=1)).isoformat(), "status":"uplink", "note":"Uplink in progress"},
+        {"time": (now + timedelta(seconds=2)).isoformat(), "status":"delivered", "note":"Delivered to satellite network"},
+    ]
+
 def send(payload, delay_seconds=1.0):
     """
     Simulate a sequence of satellite events. Returns list of events.
+    Events carry staggered timestamps and are returned immediately, so the
+    caller's thread is never blocked; delay_seconds is only used by stream().
+    """
+    return _events(datetime.utcnow())
+
+def stream(payload, delay_seconds=1.0):
+    """
+    Yield the same events one at a time with staged delays, for callers that
+    want progressive display (e.g. inside st.status or st.write_stream).
     """
-    events = []
-    now = datetime.utcnow()
-    events.append({"time": now.isoformat(), "status":"queued", "note":"Queued for uplink"})
+    events = _events(datetime.utcnow())
+    yield events[0]
     time.sleep(delay_seconds * 0.2)
-    events.append({"time": (now + timedelta(seconds=1)).isoformat(), "status":"uplink", "note":"Uplink in progress"})
+    yield events[1]
     time.sleep(delay_seconds * 0.5)
-    events.append({"time": (now + timedelta(seconds=2)).isoformat(), "status":"delivered", "note":"Delivered to satellite network"})
-    return events
\ No newline at end of file
+    yield events[2]
@@ -2,24 +2,94 @@
 Text-to-speech generator with multilingual support.
 """
 
+import hashlib
 import os
+from functools import lru_cache
 from pathlib import Path
 from gtts import gTTS
 
+ALERTS_DIR = Path("data/alerts")
+
+def _is_audio(fname):
+    """
+    True if fname holds a finished MP3 rather than a missing or empty file.
+    """
+    try:
+        return fname.stat().st_size > 0
+    except OSError:
+        return False
+
+def _save_mp3(text, lang, fname):
+    """
+    Synthesize into a temp file and move it into place, so a failed
+    request never leaves a partial file at the final path.
+    """
+    tmp = fname.with_name(fname.name + ".part")
+    try:
+        gTTS(text=text, lang=lang).save(tmp)
+        os.replace(tmp, fname)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+# Fixed advisory per severity tier; a small closed set worth rendering
+# ahead of time. The app speaks it when live synthesis is unavailable.
+FIXED_ADVISORY = "{severity} advisory: Follow local safety instructions."
+SEVERITIES = ("Low", "Medium", "High", "Critical")
+PRECOMPUTED = {
+    ("en", FIXED_ADVISORY.format(severity=s)): ALERTS_DIR / f"tts_en_{s.lower()}.mp3"
+    for s in SEVERITIES
+}
+# Only phrases whose MP3 is already on disk are served directly
+_precomputed_ready = {k: str(p) for k, p in PRECOMPUTED.items() if _is_audio(p)}
+
+@lru_cache(maxsize=64)
+def _synthesize(text, lang):
+    """
+    Return the MP3 path for (text, lang), calling gTTS only if it is not
+    already on disk. Files are named by a content hash, so identical
+    advisories skip the network round-trip even across restarts.
+    Failures raise and are therefore not memoized.
+    """
+    h = hashlib.blake2b(text.encode("utf-8") + lang.encode("utf-8"), digest_size=12).hexdigest()
+    fname = ALERTS_DIR / f"tts_{lang}_{h}.mp3"
+    if not _is_audio(fname):
+        _save_mp3(text, lang, fname)
+    return str(fname)
+
 def generate_tts(text, lang="en"):
     """
     Generate MP3 advisory in selected language.
     """
-    alerts_dir = Path("data/alerts")
-    alerts_dir.mkdir(parents=True, exist_ok=True)
-    fname = alerts_dir / f"tts_{lang}.mp3"
+    hit = _precomputed_ready.get((lang, text))
+    if hit is not None:
+        return hit
+    ALERTS_DIR.mkdir(parents=True, exist_ok=True)
     try:
-        tts = gTTS(text=text, lang=lang)
-        tts.save(fname)
-        return str(fname)
+        return _synthesize(text, lang)
     except Exception as e:
         # Fallback: save plain text file
-        fname = alerts_dir / f"tts_{lang}.txt"
+        fname = ALERTS_DIR / f"tts_{lang}.txt"
         with open(fname,"w",encoding="utf-8") as f:
             f.write(text + f"\n(TTS unavailable: {e})")
         return str(fname)
+
+def precomputed_advisory(severity):
+    """
+    Prerendered MP3 of the fixed advisory for an English severity tier,
+    or None if it has not been generated.
+    """
+    return _precomputed_ready.get(("en", FIXED_ADVISORY.format(severity=severity)))
+
+def precompute_common_phrases():
+    """
+    Render every PRECOMPUTED phrase that is missing on disk.
+    Run once at build time: python -m src.tts
+    """
+    ALERTS_DIR.mkdir(parents=True, exist_ok=True)
+    for (lang, text), fname in PRECOMPUTED.items():
+        if not _is_audio(fname):
+            _save_mp3(text, lang, fname)
+        _precomputed_ready[(lang, text)] = str(fname)
+
+if __name__ == "__main__":
+    precompute_common_phrases()
@@ -1,10 +1,29 @@
+import copy
+
 import folium
+from folium.plugins import FastMarkerCluster
+import streamlit as st
 from streamlit.components.v1 import html
 
+# Icon settings resolved once. A folium.Icon binds to the marker it is added
+# to, so each marker still gets its own Icon built from these.
+_ORIGIN_ICON = {"color": "green", "icon": "user", "prefix": "glyphicon"}
+_START_ICON = {"color": "green", "icon": "play", "prefix": "fa"}
+_END_ICON = {"color": "red", "icon": "stop", "prefix": "fa"}
+
+# Above this many shelters, emit one clustered JS blob instead of N markers
+FAST_CLUSTER_THRESHOLD = 500
+
 def create_base_map(center_point=(9.931233,76.267304), zoom_start=15):
     """
     Create a base folium map with multiple tile options.
+    The tile/layer setup is built once per (center_point, zoom_start) and
+    deep-copied, so callers can add layers without touching the cached map.
     """
+    return copy.deepcopy(_base_map_prototype(tuple(center_point), zoom_start))
+
+@st.cache_resource(show_spinner=False)
+def _base_map_prototype(center_point, zoom_start):
     try:
         m = folium.Map(
             location=center_point,
@@ -71,20 +90,36 @@ def add_shelters_to_map(m, shelters_df, i18n=None):
         return
     if shelters_df is None or shelters_df.empty:
         return
+    if len(shelters_df) > FAST_CLUSTER_THRESHOLD:
+        try:
+            coords = shelters_df[["lat", "lon"]].astype(float)
+            coords = coords[(coords["lat"] != 0) | (coords["lon"] != 0)]
+            FastMarkerCluster(coords.values.tolist(), name="Shelters", control=False).add_to(m)
+        except Exception as e:
+            print(f"Error in add_shelters_to_map: {e}")
+        return
     try:
-        for _, r in shelters_df.iterrows():
+        shelter_label = i18n.get('shelter', 'Shelter') if i18n and isinstance(i18n, dict) else 'Shelter'
+        capacity_label = i18n.get('capacity', 'Capacity') if i18n and isinstance(i18n, dict) else 'Capacity'
+
+        # Pull plain columns once instead of boxing every row into a Series
+        n = len(shelters_df)
+        def column(key, default):
+            return shelters_df[key].tolist() if key in shelters_df.columns else [default] * n
+        rows = zip(column('lat', 0), column('lon', 0), column('name', 'Shelter'), column('capacity', 'Unknown'))
+
+        # Collect markers in one group and attach it to the map once
+        group = folium.FeatureGroup(name="Shelters", control=False)
+        for lat, lon, name, capacity in rows:
             try:
-                name = str(r.get('name', 'Shelter'))
-                capacity = str(r.get('capacity', 'Unknown'))
-                lat = float(r.get('lat', 0))
-                lon = float(r.get('lon', 0))
+                name = str(name)
+                capacity = str(capacity)
+                lat = float(lat)
+                lon = float(lon)
                 
                 if lat == 0 and lon == 0:
                     continue  # Skip invalid coordinates
                 
-                shelter_label = i18n.get('shelter', 'Shelter') if i18n and isinstance(i18n, dict) else 'Shelter'
-                capacity_label = i18n.get('capacity', 'Capacity') if i18n and isinstance(i18n, dict) else 'Capacity'
-                
                 popup_text = f"<b>{shelter_label}</b>: {name}<br>{capacity_label}: {capacity}"
                 
                 folium.CircleMarker(
@@ -95,10 +130,11 @@ def add_shelters_to_map(m, shelters_df, i18n=None):
                     fillColor="blue",
                     popup=folium.Popup(popup_text, max_width=200),
                     tooltip=f"{name} ({capacity})"
-                ).add_to(m)
+                ).add_to(group)
             except Exception as e:
-                print(f"Error adding shelter {r.get('name', 'unknown')}: {e}")
+                print(f"Error adding shelter {name}: {e}")
                 continue
+        group.add_to(m)
     except Exception as e:
         print(f"Error in add_shelters_to_map: {e}")
 
@@ -112,7 +148,7 @@ def add_origin_to_map(m, origin, i18n=None):
         label = i18n.get("origin", "Origin") if i18n and isinstance(i18n, dict) else "Origin"
         folium.Marker(
             location=origin,
-            icon=folium.Icon(color="green", icon="user", prefix="glyphicon"),
+            icon=folium.Icon(**_ORIGIN_ICON),
             popup=folium.Popup(f"<b>{label}</b>", max_width=150),
             tooltip=label
         ).add_to(m)
@@ -145,12 +181,12 @@ def add_route_to_map(m, route, i18n=None):
         if len(route) >= 2:
             folium.Marker(
                 location=route[0],
-                icon=folium.Icon(color="green", icon="play", prefix="fa"),
+                icon=folium.Icon(**_START_ICON),
                 popup="Start"
             ).add_to(m)
             folium.Marker(
                 location=route[-1],
-                icon=folium.Icon(color="red", icon="stop", prefix="fa"),
+                icon=folium.Icon(**_END_ICON),
                 popup="End"
             ).add_to(m)
     except Exception as e:
@@ -170,15 +206,15 @@ def add_reports_to_map(m, reports, i18n=None):
     if not reports:
         return
     try:
-        for r in reports:
-            lat = r.get("lat")
-            lon = r.get("lon")
-            if lat is None or lon is None:
-                continue
-            r_type = r.get("type", "Incident")
-            severity = r.get("severity", "medium")
-            note = r.get("note", "")
-            label = i18n.get("report", "Report") if i18n and isinstance(i18n, dict) else "Report"
+        label = i18n.get("report", "Report") if i18n and isinstance(i18n, dict) else "Report"
+        # Flatten the dicts once up front, dropping reports without coordinates
+        rows = [
+            (r.get("lat"), r.get("lon"), r.get("type", "Incident"), r.get("severity", "medium"), r.get("note", ""))
+            for r in reports
+            if r.get("lat") is not None and r.get("lon") is not None
+        ]
+        group = folium.FeatureGroup(name="Reports", control=False)
+        for lat, lon, r_type, severity, note in rows:
             popup_html = f"<b>{label}</b>: {r_type}<br>Severity: {severity}<br>{note}"
             folium.CircleMarker(
                 location=(lat, lon),
@@ -188,7 +224,8 @@ def add_reports_to_map(m, reports, i18n=None):
                 fillColor="red",
                 popup=folium.Popup(popup_html, max_width=250),
                 tooltip=f"{r_type} ({severity})",
-            ).add_to(m)
+            ).add_to(group)
+        group.add_to(m)
     except Exception as e:
         print(f"Error adding reports to map: {e}")
 